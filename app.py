@@ -1,23 +1,26 @@
 import streamlit as st
 import pandas as pd
-import pydeck as pdk
-import plotly.express as px
+import mmap
 import os
 import re
-import base64
+
+from constants import LANGUAGES, STRINGS
 
 # ==========================================
 # 👇 1. User Configuration Area (Relative paths for cloud deployment)
 # ==========================================
 LOCATIONS_CSV_PATH = "儒林外史_7_Cities.csv"
+ALIASES_CSV_PATH = "aliases.csv"  # One row per (city, alias); aliases are in Chinese to match the source text
 TXT_FILE_PATH = "总.txt"
 CHAPTER_INFO_PATH = "chapter_data.xlsx"
-PICTURE_PATH = "BG.jpg"
+CHAPTER_INFO_CACHE_PATH = "chapter_data.parquet"  # Generated from the Excel file on first load
+PICTURE_PATH = "static/BG.jpg"  # Served at app/static/ (enableStaticServing in .streamlit/config.toml)
 # ==========================================
 
 # 2. Basic Page Configuration
+# The language picker lives in the sidebar; its last value is already in session state on reruns
 st.set_page_config(
-    page_title="The Scholars Location Analysis",
+    page_title=STRINGS[st.session_state.get("lang", "en")]["page_title"],
     page_icon="🗺️",
     layout="wide"
 )
@@ -25,17 +28,15 @@ st.set_page_config(
 # --- Function to Set Background Image ---
 def set_bg_hack(main_bg):
     """
-    A function to unpack an image from root folder and set as bg.
+    A function to set an image from the static folder as bg.
+    The browser fetches and caches it, instead of receiving it inlined on every rerun.
     """
     if os.path.exists(main_bg):
-        with open(main_bg, "rb") as f:
-            data = f.read()
-            bin_str = base64.b64encode(data).decode()
         st.markdown(
             f"""
             <style>
             .stApp {{
-                background-image: url("data:image/jpg;base64,{bin_str}");
+                background-image: url("./app/static/{os.path.basename(main_bg)}");
                 background-size: cover;
                 background-position: center;
                 background-repeat: no-repeat;
@@ -56,29 +57,54 @@ def set_bg_hack(main_bg):
 # Apply background
 set_bg_hack(PICTURE_PATH)
 
-# --- Define Location Dictionary (Used for statistical analysis of the original text) ---
-# NOTE: 'aliases' are kept in Chinese to match the source text file.
-LOCATIONS_DB = [
-    {"name": "Hangzhou",
-     "aliases": ["杭州", "杭城", "西湖", "省城", "武林", "錢塘", "斷河頭", "清波門", "仁和", "錢塘門", "靈隱", "天竺",
-                 "蘇堤", "雷峰", "淨慈", "城隍山", "吳山"]},
-    {"name": "Huzhou", "aliases": ["湖州", "鶯脰湖", "新市鎮", "雙林", "婁府", "烏程"]},
-    {"name": "Beijing",
-     "aliases": ["北京", "京師", "京裏", "京城", "都門", "魏闕", "長安", "順天府", "內廷", "入京", "進京"]},
-    {"name": "Nanjing", "aliases": ["南京", "金陵", "白下", "建康", "應天"]},
-    {"name": "Yangzhou", "aliases": ["揚州", "廣陵", "維揚", "江都"]},
-    {"name": "Jinan", "aliases": ["濟南", "歷下"]},
-    {"name": "Suzhou", "aliases": ["蘇州", "姑蘇", "吳門", "平江"]},
-    {"name": "Wenzhou", "aliases": ["溫州", "樂清"]},
-    {"name": "Shaoxing", "aliases": ["紹興", "會稽", "越城"]}
+# --- Language Selection (all user-facing text comes from STRINGS[LANG]) ---
+LANG = st.sidebar.selectbox("Language / 语言", list(LANGUAGES), format_func=LANGUAGES.get, key="lang")
+T = STRINGS[LANG]
+
+
+# --- Define Route Data (Character Route tab) ---
+# Names and active chapters come from STRINGS[LANG]["routes"], in the same order
+ROUTES_DATA = [
+    {"icon": "🔴", "color": [255, 0, 0],
+     "path": [[120.98, 28.12], [120.15, 30.27], [120.58, 30.00], [120.15, 30.27], [119.41, 32.39], [116.40, 39.90]]},
+    {"icon": "🔵", "color": [0, 128, 255],
+     "path": [[120.75, 30.75], [120.15, 30.27]]},
+    {"icon": "🟢", "color": [0, 128, 0],
+     "path": [[120.58, 30.00], [120.08, 30.89], [119.41, 32.39], [118.37, 31.35]]},
 ]
+ROUTES_BY_LANG = {
+    lang: [{"color": r["color"], "path": r["path"], **text} for r, text in zip(ROUTES_DATA, strings["routes"])]
+    for lang, strings in STRINGS.items()
+}
+ROUTE_POINTS_BY_LANG = {
+    lang: [{"coord": p, "name": r["name"], "color": r["color"]} for r in routes for p in r["path"]]
+    for lang, routes in ROUTES_BY_LANG.items()
+}
 
 
 # 3. Data Loading Functions
 @st.cache_data
 def load_map_data():
     if not os.path.exists(LOCATIONS_CSV_PATH): return None
-    return pd.read_csv(LOCATIONS_CSV_PATH, encoding="utf-8-sig")
+    df = pd.read_csv(LOCATIONS_CSV_PATH, encoding="utf-8-sig", engine="pyarrow")
+    # Shrink the frame for the sidebar preview and charts. Lon/Lat stay float64:
+    # float32 values serialize to longer decimals in the pydeck JSON spec.
+    df["Type"] = df["Type"].astype("category")
+    df["Frequency"] = pd.to_numeric(df["Frequency"], downcast="integer")
+    return df
+
+
+@st.cache_data
+def load_aliases():
+    """Load the location dictionary used for statistical analysis of the original text."""
+    if not os.path.exists(ALIASES_CSV_PATH): return None
+    df = pd.read_csv(ALIASES_CSV_PATH, encoding="utf-8-sig", engine="pyarrow")
+    # Skip blank alias cells left by hand edits; an empty alternative would match everywhere
+    df = df.dropna(subset=["alias"])
+    df = df[df["alias"].str.strip() != ""].reset_index(drop=True)
+    # Categories keep the cities in file order
+    df["city"] = df["city"].astype(pd.CategoricalDtype(df["city"].unique()))
+    return df
 
 
 @st.cache_data
@@ -88,266 +114,271 @@ def load_text_data():
         return f.read()
 
 
+@st.cache_resource
+def get_text_mmap():
+    """Memory-map the raw UTF-8 text for keyword search; pages are shared with the OS page cache."""
+    with open(TXT_FILE_PATH, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 @st.cache_data
 def load_chapter_info():
     if not os.path.exists(CHAPTER_INFO_PATH): return None
-    try:
-        # Use read_excel to read .xlsx, specifying engine
-        return pd.read_excel(CHAPTER_INFO_PATH, engine='openpyxl')
-    except Exception as e:
-        st.error(f"Failed to read Excel: {e}")
-        return None
+    df = None
+    # Reuse the Parquet copy unless the Excel file has been edited since it was written
+    if (os.path.exists(CHAPTER_INFO_CACHE_PATH)
+            and os.path.getmtime(CHAPTER_INFO_CACHE_PATH) >= os.path.getmtime(CHAPTER_INFO_PATH)):
+        try:
+            df = pd.read_parquet(CHAPTER_INFO_CACHE_PATH)
+        except Exception:
+            pass  # A truncated or corrupt copy is simply rebuilt from the Excel file below
+    if df is None:
+        try:
+            # Use read_excel to read .xlsx, specifying engine
+            df = pd.read_excel(CHAPTER_INFO_PATH, engine='openpyxl')
+        except Exception as e:
+            st.error(f"Failed to read Excel: {e}")
+            return None
+        try:
+            df.to_parquet(CHAPTER_INFO_CACHE_PATH)
+        except Exception:
+            # The Parquet copy is only an optimisation: read-only deployments and columns
+            # Arrow cannot type (e.g. a "楔子" row among chapter numbers) keep using the Excel data
+            pass
+    # Chapter numbers are small integers
+    int_cols = df.select_dtypes("integer").columns
+    df[int_cols] = df[int_cols].apply(pd.to_numeric, downcast="integer")
+    return df
+
+
+# Compiled once so they don't depend on the re module's shared cache
+CHAPTER_SPLIT_RE = re.compile(r'(?=\*[^\n]+)')  # Each chapter starts with a "*Title" line
+CHAPTER_TITLE_RE = re.compile(r'^\*?([^\n]*)')
 
 
 @st.cache_data
-def process_chapter_stats(text):
+def process_chapter_stats(text, df_aliases):
     """Split text by chapters and count location frequencies."""
-    chapters = re.split(r'(?=\*[^\n]+)', text)
-    chapter_data = []
-    for chapter in chapters:
-        if not chapter.strip(): continue
-        lines = chapter.split('\n')
-        title = lines[0].replace('*', '').strip()
-        short_title = title.split(' ')[0] if ' ' in title else title[:6]
-
-        row = {"Chapter": short_title, "Full_Title": title}
-        for loc in LOCATIONS_DB:
-            count = 0
-            for alias in loc["aliases"]:
-                count += chapter.count(alias)
-            row[loc["name"]] = count
-        chapter_data.append(row)
-    return pd.DataFrame(chapter_data)
+    chapters = pd.Series(CHAPTER_SPLIT_RE.split(text))
+    chapters = chapters[chapters.str.strip().astype(bool)].reset_index(drop=True)
+
+    titles = chapters.str.extract(CHAPTER_TITLE_RE, expand=False).str.replace('*', '', regex=False).str.strip()
+    short_titles = titles.str.split(' ').str[0].where(titles.str.contains(' ', regex=False), titles.str[:6])
+
+    # One alternation per city, longest alias first, so each mention is counted once
+    # (e.g. "錢塘門" no longer also counts as "錢塘"). Matching runs on UTF-8 bytes;
+    # UTF-8 is self-synchronizing, so byte matches are exactly character matches
+    cities = list(df_aliases["city"].cat.categories)
+    city_patterns = [
+        re.compile(b"|".join(re.escape(alias.encode("utf-8"))
+                             for alias in sorted(group["alias"], key=len, reverse=True)))
+        for _, group in df_aliases.groupby("city", observed=True, sort=True)
+    ]
+    chapters_b = [chapter.encode("utf-8") for chapter in chapters]
+    city_counts = pd.DataFrame([[len(pattern.findall(chapter_b)) for pattern in city_patterns]
+                                for chapter_b in chapters_b], columns=cities)
+
+    return pd.concat([pd.DataFrame({"Chapter": short_titles, "Full_Title": titles}), city_counts], axis=1)
+
+
+# --- Chart Libraries (imported where first needed, so the header and sidebar render before they load) ---
+def import_plotly_express():
+    """Import plotly.express, serializing figures with orjson (fails loudly if it is missing)."""
+    import plotly.express as px
+    import plotly.io as pio
+    pio.json.config.default_engine = "orjson"
+    return px
+
+
+# --- Map Builders (cached so unrelated widget reruns reuse the same Deck objects) ---
+@st.cache_resource
+def build_map_deck(df, tooltip_html):
+    """Build the location frequency map."""
+    import pydeck as pdk
+    # st.pydeck_chart ships layer data as JSON (pydeck's binary transport is Jupyter-only),
+    # so send only the columns the layer and tooltip read. Plain records also leave
+    # st.pydeck_chart nothing to convert in place on this Deck, which every session shares.
+    layer = pdk.Layer(
+        "ScatterplotLayer",
+        df[["Name", "Lon", "Lat", "Frequency", "Type"]].to_dict("records"),
+        get_position='[Lon, Lat]',
+        get_color='[200, 30, 0, 160]',
+        get_radius='Frequency',
+        radius_scale=4000,
+        pickable=True,
+        auto_highlight=True
+    )
+    view_state = pdk.ViewState(latitude=31.0, longitude=119.0, zoom=5)
+    return pdk.Deck(
+        map_provider="carto",
+        map_style="light",
+        initial_view_state=view_state,
+        layers=[layer],
+        tooltip={"html": tooltip_html}
+    )
+
+
+@st.cache_resource
+def build_route_deck(routes, points, tooltip_html):
+    """Build the character trajectory map: one path per character plus a marker at each stop."""
+    import pydeck as pdk
+    view_state_route = pdk.ViewState(latitude=32.0, longitude=118.0, zoom=5)
+    layer_routes = pdk.Layer("PathLayer", routes, pickable=True, get_color="color", width_scale=20,
+                             width_min_pixels=3, get_path="path", get_width=5)
+    layer_points = pdk.Layer("ScatterplotLayer", points, get_position="coord", get_color="color",
+                             get_radius=8000, pickable=True)
+
+    return pdk.Deck(
+        map_provider="carto", map_style="light", initial_view_state=view_state_route,
+        layers=[layer_routes, layer_points],
+        tooltip={"html": tooltip_html,
+                 "style": {"backgroundColor": "steelblue", "color": "white"}}
+    )
+
+
+# --- Keyword Search (a fragment: typing reruns only this block, not the whole app) ---
+@st.fragment
+def keyword_search_fragment(text_mm, strings):
+    """Show up to three paragraphs of the original text containing the keyword."""
+    # Default value kept in Chinese as it searches the source text
+    search_term = st.text_input(strings["search_label"], "西湖", key="search_term_input")
+
+    if search_term:
+        needle = search_term.encode("utf-8")
+        count = 0
+        pos = text_mm.find(needle)
+        while pos != -1:
+            # Expand the hit to its enclosing paragraph (one line of the file), then resume after it
+            start = text_mm.rfind(b"\n", 0, pos) + 1
+            end = text_mm.find(b"\n", pos)
+            if end == -1: end = len(text_mm)
+            st.markdown(f"**...{text_mm[start:end].decode('utf-8').strip()}...**")
+            st.divider()
+            count += 1
+            if count >= 3: break
+            pos = text_mm.find(needle, end + 1)
+        if count == 0: st.warning(strings["no_results"])
 
 
 # Execute Loading
 df_map = load_map_data()
-full_text = load_text_data()
+df_aliases = load_aliases()
 df_info = load_chapter_info()
 
 # Error Checking
-if df_map is None or full_text is None:
-    st.error("❌ Missing basic data files. Please check if csv and txt files are uploaded to the GitHub repository.")
+if df_map is None or df_aliases is None or not os.path.exists(TXT_FILE_PATH):
+    st.error(T["missing_data"])
     st.stop()
 
-df_stats = process_chapter_stats(full_text)
+# Keep the stats for the whole session even if the global cache evicts them;
+# the full text is only loaded when they have to be computed
+if "df_stats" not in st.session_state:
+    st.session_state.df_stats = process_chapter_stats(load_text_data(), df_aliases)
+df_stats = st.session_state.df_stats
 
 # ==========================================
 # 4. Interface Layout
 # ==========================================
 
-st.title("🗺️ Spatial Analysis of *The Scholars* (Chapters 10-20)")
-st.markdown("""
-**Digital Humanities Analysis of *The Scholars* (Ch. 10-20)**
-This application combines **GIS spatial analysis** and **close reading** to explore the mobility of scholars between the arena of fame and profit (Hangzhou) and the center of power (Beijing).
-""")
+st.title(T["title"])
+st.markdown(T["intro"])
 st.markdown("---")
 
 # --- Sidebar ---
 with st.sidebar:
-    st.header("📊 Data Console")
-    st.success(f"✅ Loaded location data: {len(df_map)} items")
+    st.header(T["sidebar_header"])
+    st.success(T["loaded_locations"].format(n=len(df_map)))
     if df_info is not None:
-        st.success(f"✅ Loaded plot data: {len(df_info)} chapters")
+        st.success(T["loaded_chapters"].format(n=len(df_info)))
     else:
-        st.warning("⚠️ Chapter plot Excel file not found")
+        st.warning(T["no_chapter_info"])
 
     st.markdown("---")
-    st.write("**Map Data Preview:**")
+    st.write(T["map_preview"])
     st.dataframe(df_map, use_container_width=True)
 
 # --- Tab Layout Management ---
-tab_map, tab_trend, tab_details, tab_insight, tab_route = st.tabs([
-    "Map",
-    "Trend",
-    "Details",
-    "Insights",
-    "Route"
-])
+tab_map, tab_trend, tab_details, tab_insight, tab_route = st.tabs(T["tabs"])
 
 # === TAB 1: Map & Ranking ===
 with tab_map:
+    px = import_plotly_express()
     col1, col2 = st.columns([3, 2])
     with col1:
-        st.subheader("Location Frequency Map")
-        layer = pdk.Layer(
-            "ScatterplotLayer",
-            df_map,
-            get_position='[Lon, Lat]',
-            get_color='[200, 30, 0, 160]',
-            get_radius='Frequency * 4000',
-            pickable=True,
-            auto_highlight=True
-        )
-        view_state = pdk.ViewState(latitude=31.0, longitude=119.0, zoom=5)
-        st.pydeck_chart(pdk.Deck(
-            map_provider="carto",
-            map_style="light",
-            initial_view_state=view_state,
-            layers=[layer],
-            tooltip={"html": "<b>{Name}</b><br/>Frequency: {Frequency}<br/>Type: {Type}"}
-        ))
+        st.subheader(T["map_subheader"])
+        st.pydeck_chart(build_map_deck(df_map, T["map_tooltip"]))
     with col2:
-        st.subheader("Total Frequency Ranking")
+        st.subheader(T["ranking_subheader"])
         fig_bar = px.bar(df_map.sort_values('Frequency', ascending=True), x='Frequency', y='Name', orientation='h',
                          color='Type')
         st.plotly_chart(fig_bar, use_container_width=True)
 
 # === TAB 2: Trend Analysis ===
 with tab_trend:
-    st.subheader("Location Activity by Chapter")
-    cities_list = [loc["name"] for loc in LOCATIONS_DB]
-    df_heatmap = df_stats.melt(id_vars=["Chapter", "Full_Title"], value_vars=cities_list, var_name="City",
-                               value_name="Count")
-
-    fig_heatmap = px.density_heatmap(
-        df_heatmap, x="Chapter", y="City", z="Count", color_continuous_scale="Reds",
-        labels={"Chapter": "Chapter", "City": "City", "Count": "Frequency"}, height=500
+    px = import_plotly_express()
+    st.subheader(T["trend_subheader"])
+    cities_list = list(df_aliases["city"].cat.categories)
+    # The city x chapter matrix is already aggregated, so plot it directly instead of melting and re-binning
+    fig_heatmap = px.imshow(
+        df_stats.set_index("Chapter")[cities_list].T.rename(index=T["city_names"]),
+        color_continuous_scale="Reds", aspect="auto", labels=T["heatmap_labels"], height=500
     )
     st.plotly_chart(fig_heatmap, use_container_width=True)
 
 # === TAB 3: Chapter Details (Reads Excel Data) ===
 with tab_details:
-    st.header("📖 Chapter Characters and Plot Comparison")
+    st.header(T["details_header"])
 
     if df_info is not None:
         if 'CHAPTER' in df_info.columns:
             chapter_list = df_info['CHAPTER'].unique()
-            selected_chapter = st.selectbox("Select a chapter to view:", chapter_list)
+            selected_chapter = st.selectbox(T["select_chapter"], chapter_list)
 
             chapter_row = df_info[df_info['CHAPTER'] == selected_chapter].iloc[0]
 
             c1, c2 = st.columns([1, 2])
 
             with c1:
-                st.info("### 🎭 Key Characters")
-                chars = str(chapter_row.get('CHARACTERS', 'No Data')).replace('\n', '  \n')
+                st.info(T["key_characters"])
+                chars = str(chapter_row.get('CHARACTERS', T["no_data"])).replace('\n', '  \n')
                 st.markdown(chars)
 
             with c2:
-                st.warning("### ⚡ Key Events")
-                events = str(chapter_row.get('MAIN PLOTS', 'No Data')).replace('\n', '  \n')
+                st.warning(T["key_events"])
+                events = str(chapter_row.get('MAIN PLOTS', T["no_data"])).replace('\n', '  \n')
                 st.markdown(events)
 
-            with st.expander("Summary", expanded=True):
-                st.write(chapter_row.get('SUMMARY', 'No Data'))
+            with st.expander(T["summary"], expanded=True):
+                st.write(chapter_row.get('SUMMARY', T["no_data"]))
         else:
-            st.error("Excel file column names do not match. Please check if it contains 'CHAPTER', 'CHARACTERS', 'MAIN PLOTS', 'SUMMARY'")
+            st.error(T["bad_columns"])
     else:
-        st.error(f"Please ensure '{CHAPTER_INFO_PATH}' is uploaded.")
+        st.error(T["missing_chapter_info"].format(path=CHAPTER_INFO_PATH))
 
 # === TAB 4: Deep Analysis ===
 with tab_insight:
-    st.subheader("Insights: The Flow of Space and Morality")
-
-    st.markdown("""
-    ### 1. The Binary Opposition of Cultural Spaces: Centrifugal Civil Society vs. Centripetal Power Machine
-
-    * **Hangzhou as a "Centrifugal Civil Society"**: Hangzhou presents itself as a **decentralized, multi-nodal, self-organizing** ecosystem of fame and profit. There is no absolute authority here; power is dispersed among various figures like Ma Er (essay selection), Jing Lanjiang (poetry fame), Pan San (government office underground), and Wen Jianfeng (gatherings). It is a complex network driven by **commercial capital (bookstores), cultural prestige (literary gatherings), and the underground economy (lawsuits)**. Its social structure is **flat, fluid, and full of opportunities and traps**. Scholars here experience a **horizontal, divergent struggle and maneuvering**.
-
-    * **Beijing as a "Centripetal Power Machine"**: Beijing exists as a **vertical, strictly hierarchical ultimate power field**. Its influence, though remote, is omnipresent. Through **civil service examinations, official personnel affairs, and gentry networks**, it sucks in resources and talent from across the country like a black hole, dictating the ultimate orientation of all social values. In Beijing, all behavior is reduced to **clinging to and parasitizing higher power strata**. Its social structure is **pyramidal and closed**. Scholars here experience a **vertical, oppressive, yet tempting anxiety for promotion**.
-
-    ### 2. Spatial Narrative of Moral Degeneration (Kuang Chaoren)
-
-    * **Kuang Chaoren as a "Spatial Traveler"**: He is a **specimen constantly migrating within the empire's core cultural spaces**. His trajectory from the countryside (Wenzhou) to the regional center (Hangzhou), and finally to the imperial heart (Beijing), completely demonstrates how a lower-class scholar is shaped by the production logic of different spaces. He is not a fixed resident of any place, but a **keen learner and speculator of spatial rules**, quickly mastering the survival laws of each space and becoming alienated by them.
-
-    * **Ideological Level: From Confucian Ethics to Utilitarianism**. His ideological transformation trajectory is clear: starting with the **natural concept of filial piety** during the Wenzhou period; passing through the **market survival philosophy of "whoever feeds me is my mother"** formed under Pan San's tutelage in Hangzhou; and finally solidifying into the **extreme egoism of calculated interest** in Beijing. His worldview completes a thorough metamorphosis from **value rationality** to **instrumental rationality**.
-
-    * **Tragic Spatial Symbols**:
-        * **Wenhan Building in Hangzhou**: A place of alienated knowledge production. Here, he annotates model examination essays night after night. This space, which should be sacred for "seeking knowledge," runs parallel to his cheating in exams and participation in fraud. **Wenhan Building symbolizes the complete separation of his "knowledge" and "morality"**.
-        * **Wedding Room in Beijing**: A ritual space for identity reconstruction and the end of humanity. In the wedding room in Beijing, through a wedding built on lies (concealing his first wife), he completes the whitewashing and elevation of his social identity. This space, which should symbolize the joyous union of human relations, becomes **the altar where he buries his last shred of conscience and completely instrumentalizes himself**.
+    st.subheader(T["insight_subheader"])
 
-    ### 3. The Persistence of Ma Chunshang
-
-    * **Binary Opposition of Cultural Spaces: System Guardian vs. Wandering Outcast**
-        * **Ma Er as a "Selector"**: He is a **systemic pillar of civil service examination knowledge production**. In the secular cultural market of Hangzhou, he plays the role of transforming official ideology (eight-legged essays) into standardized commodities that can be circulated and imitated. His commentaries show that he is a **rigorous, depersonalized porter of knowledge**.
-        * **Ma Er as a "Wandering Scholar"**: He himself is a **marginal scholar detached from the center of power**. This identity of a "system guardian in the wild" constitutes the root of all his comedy and tragedy.
-
-    * **Analysis of Ma Er's Personality Structure**
-        * **Ideological Level**: A "man in a case" completely disciplined by the eight-legged essay. His worldview is entirely constructed by examination essays, even believing that "civil service examinations are something everyone must do from ancient times to the present." This **high purity and enclosure** of thought makes him appear pedantic, yet it also constitutes his **moral armor** against secular temptations.
-        * **Behavioral Level**: A practitioner of Jiangnan chivalry. Although his thoughts are rigid, his actions shine with **simple Confucian chivalric spirit**. He gives all he has to help Kuang Chaoren, whom he meets by chance, demonstrating the **human brilliance retained at the practical level** by a person shaped by the system.
-
-    * **Tragic Spatial Symbols**
-        * **West Lake in Hangzhou: An Outsider in the World of Desire**. He is completely indifferent to the lake scenery and the colorful crowds, caring only about eating and the Emperor's calligraphy. This marks the **desertification of his sensory world**; his aesthetics and emotions have been completely alienated by the eight-legged essay.
-        * **Mirror Relationship with Kuang Chaoren**: Ma Er is **Kuang Chaoren's spiritual father and frame of reference**. Kuang Chaoren learned composition from him but abandoned his conduct. Ma Er's "immobility" contrasts with the drastic and inevitable nature of Kuang Chaoren's "degeneration".
-    """)
+    st.markdown(T["insights"])
 
     st.divider()
-    st.subheader("Original Text Keyword Search")
-    # Default value kept in Chinese as it searches the source text
-    search_term = st.text_input("Enter Keyword (Traditional Chinese)", "西湖", key="search_term_input")
-
-    if search_term:
-        paragraphs = full_text.replace("\\r", "").split("\\n")
-        if len(paragraphs) < 2: paragraphs = full_text.split("\n")
-        count = 0
-        for p in paragraphs:
-            if search_term in p:
-                st.markdown(f"**...{p.strip()}...**")
-                st.divider()
-                count += 1
-                if count >= 3: break
-        if count == 0: st.warning("No relevant content found.")
+    st.subheader(T["search_subheader"])
+    keyword_search_fragment(get_text_mmap(), T)
 
 # === TAB 5: Character Route (New) ===
 with tab_route:
-    # Define route data
-    ROUTES_DATA = [
-        {
-            "name": "Kuang Chaoren",
-            "color": [255, 0, 0],
-            "path": [[120.98, 28.12], [120.15, 30.27], [120.58, 30.00], [120.15, 30.27], [119.41, 32.39],
-                     [116.40, 39.90]],
-            "chapters": "Ch. 15-20"
-        },
-        {
-            "name": "Ma Chunshang",
-            "color": [0, 128, 255],
-            "path": [[120.75, 30.75], [120.15, 30.27]],
-            "chapters": "Ch. 13-15"
-        },
-        {
-            "name": "Niu Buyi",
-            "color": [0, 128, 0],
-            "path": [[120.58, 30.00], [120.08, 30.89], [119.41, 32.39], [118.37, 31.35]],
-            "chapters": "Ch. 10, 20"
-        }
-    ]
-
-    st.subheader("🚀 Character Trajectories")
+    st.subheader(T["route_subheader"])
     c_map, c_info = st.columns([3, 1])
 
     with c_map:
-        view_state_route = pdk.ViewState(latitude=32.0, longitude=118.0, zoom=5)
-        layer_routes = pdk.Layer("PathLayer", ROUTES_DATA, pickable=True, get_color="color", width_scale=20,
-                                 width_min_pixels=3, get_path="path", get_width=5)
-
-        all_points = []
-        for r in ROUTES_DATA:
-            for p in r['path']:
-                all_points.append({"coord": p, "name": r['name'], "color": r['color']})
-        layer_points = pdk.Layer("ScatterplotLayer", all_points, get_position="coord", get_color="color",
-                                 get_radius=8000, pickable=True)
-
-        st.pydeck_chart(pdk.Deck(
-            map_provider="carto", map_style="light", initial_view_state=view_state_route,
-            layers=[layer_routes, layer_points],
-            tooltip={"html": "<b>{name}</b><br/>Active Chapters: {chapters}",
-                     "style": {"backgroundColor": "steelblue", "color": "white"}}
-        ))
+        st.pydeck_chart(build_route_deck(ROUTES_BY_LANG[LANG], ROUTE_POINTS_BY_LANG[LANG], T["route_tooltip"]))
 
     with c_info:
-        st.markdown("#### 🔴 Kuang Chaoren")
-        st.caption("Route: Wenzhou -> Beijing")
-        st.write("A path of degeneration from the periphery to the center.")
-        st.divider()
-        st.markdown("#### 🔵 Ma Chunshang")
-        st.caption("Route: Jiaxing -> Hangzhou")
-        st.write("Adhering to the Confucian orthodoxy in Jiangnan.")
-        st.divider()
-        st.markdown("#### 🟢 Niu Buyi")
-        st.caption("Route: Huzhou -> Wuhu")
-        st.write("The desolation of wandering and dying in a foreign land.")
+        for i, (route, (name, caption, description)) in enumerate(zip(ROUTES_DATA, T["route_cards"])):
+            if i: st.divider()
+            st.markdown(f"#### {route['icon']} {name}")
+            st.caption(caption)
+            st.write(description)
 
 
 st.caption("Created by Streamlit | Data Source: Ctext.org")
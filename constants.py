@@ -0,0 +1,176 @@
+# ==========================================
+# UI text for each supported language (selected in the sidebar, see LANGUAGES)
+# NOTE: search defaults and location aliases stay in Chinese to match the source text file.
+# ==========================================
+LANGUAGES = {"en": "English", "zh": "中文"}
+
+STRINGS = {
+    "en": {
+        "page_title": "The Scholars Location Analysis",
+        "missing_data": "❌ Missing basic data files. Please check if csv and txt files are uploaded to the GitHub repository.",
+        "title": "🗺️ Spatial Analysis of *The Scholars* (Chapters 10-20)",
+        "intro": """
+**Digital Humanities Analysis of *The Scholars* (Ch. 10-20)**
+This application combines **GIS spatial analysis** and **close reading** to explore the mobility of scholars between the arena of fame and profit (Hangzhou) and the center of power (Beijing).
+""",
+        # Sidebar
+        "sidebar_header": "📊 Data Console",
+        "loaded_locations": "✅ Loaded location data: {n} items",
+        "loaded_chapters": "✅ Loaded plot data: {n} chapters",
+        "no_chapter_info": "⚠️ Chapter plot Excel file not found",
+        "map_preview": "**Map Data Preview:**",
+        "tabs": ["Map", "Trend", "Details", "Insights", "Route"],
+        # Tab 1: Map & Ranking
+        "map_subheader": "Location Frequency Map",
+        "map_tooltip": "<b>{Name}</b><br/>Frequency: {Frequency}<br/>Type: {Type}",
+        "ranking_subheader": "Total Frequency Ranking",
+        # Tab 2: Trend Analysis
+        "trend_subheader": "Location Activity by Chapter",
+        "heatmap_labels": {"x": "Chapter", "y": "City", "color": "Frequency"},
+        "city_names": {},
+        # Tab 3: Chapter Details
+        "details_header": "📖 Chapter Characters and Plot Comparison",
+        "select_chapter": "Select a chapter to view:",
+        "key_characters": "### 🎭 Key Characters",
+        "key_events": "### ⚡ Key Events",
+        "summary": "Summary",
+        "no_data": "No Data",
+        "bad_columns": "Excel file column names do not match. Please check if it contains 'CHAPTER', 'CHARACTERS', 'MAIN PLOTS', 'SUMMARY'",
+        "missing_chapter_info": "Please ensure '{path}' is uploaded.",
+        # Tab 4: Deep Analysis
+        "insight_subheader": "Insights: The Flow of Space and Morality",
+        "insights": """
+### 1. The Binary Opposition of Cultural Spaces: Centrifugal Civil Society vs. Centripetal Power Machine
+
+* **Hangzhou as a "Centrifugal Civil Society"**: Hangzhou presents itself as a **decentralized, multi-nodal, self-organizing** ecosystem of fame and profit. There is no absolute authority here; power is dispersed among various figures like Ma Er (essay selection), Jing Lanjiang (poetry fame), Pan San (government office underground), and Wen Jianfeng (gatherings). It is a complex network driven by **commercial capital (bookstores), cultural prestige (literary gatherings), and the underground economy (lawsuits)**. Its social structure is **flat, fluid, and full of opportunities and traps**. Scholars here experience a **horizontal, divergent struggle and maneuvering**.
+
+* **Beijing as a "Centripetal Power Machine"**: Beijing exists as a **vertical, strictly hierarchical ultimate power field**. Its influence, though remote, is omnipresent. Through **civil service examinations, official personnel affairs, and gentry networks**, it sucks in resources and talent from across the country like a black hole, dictating the ultimate orientation of all social values. In Beijing, all behavior is reduced to **clinging to and parasitizing higher power strata**. Its social structure is **pyramidal and closed**. Scholars here experience a **vertical, oppressive, yet tempting anxiety for promotion**.
+
+### 2. Spatial Narrative of Moral Degeneration (Kuang Chaoren)
+
+* **Kuang Chaoren as a "Spatial Traveler"**: He is a **specimen constantly migrating within the empire's core cultural spaces**. His trajectory from the countryside (Wenzhou) to the regional center (Hangzhou), and finally to the imperial heart (Beijing), completely demonstrates how a lower-class scholar is shaped by the production logic of different spaces. He is not a fixed resident of any place, but a **keen learner and speculator of spatial rules**, quickly mastering the survival laws of each space and becoming alienated by them.
+
+* **Ideological Level: From Confucian Ethics to Utilitarianism**. His ideological transformation trajectory is clear: starting with the **natural concept of filial piety** during the Wenzhou period; passing through the **market survival philosophy of "whoever feeds me is my mother"** formed under Pan San's tutelage in Hangzhou; and finally solidifying into the **extreme egoism of calculated interest** in Beijing. His worldview completes a thorough metamorphosis from **value rationality** to **instrumental rationality**.
+
+* **Tragic Spatial Symbols**:
+    * **Wenhan Building in Hangzhou**: A place of alienated knowledge production. Here, he annotates model examination essays night after night. This space, which should be sacred for "seeking knowledge," runs parallel to his cheating in exams and participation in fraud. **Wenhan Building symbolizes the complete separation of his "knowledge" and "morality"**.
+    * **Wedding Room in Beijing**: A ritual space for identity reconstruction and the end of humanity. In the wedding room in Beijing, through a wedding built on lies (concealing his first wife), he completes the whitewashing and elevation of his social identity. This space, which should symbolize the joyous union of human relations, becomes **the altar where he buries his last shred of conscience and completely instrumentalizes himself**.
+
+### 3. The Persistence of Ma Chunshang
+
+* **Binary Opposition of Cultural Spaces: System Guardian vs. Wandering Outcast**
+    * **Ma Er as a "Selector"**: He is a **systemic pillar of civil service examination knowledge production**. In the secular cultural market of Hangzhou, he plays the role of transforming official ideology (eight-legged essays) into standardized commodities that can be circulated and imitated. His commentaries show that he is a **rigorous, depersonalized porter of knowledge**.
+    * **Ma Er as a "Wandering Scholar"**: He himself is a **marginal scholar detached from the center of power**. This identity of a "system guardian in the wild" constitutes the root of all his comedy and tragedy.
+
+* **Analysis of Ma Er's Personality Structure**
+    * **Ideological Level**: A "man in a case" completely disciplined by the eight-legged essay. His worldview is entirely constructed by examination essays, even believing that "civil service examinations are something everyone must do from ancient times to the present." This **high purity and enclosure** of thought makes him appear pedantic, yet it also constitutes his **moral armor** against secular temptations.
+    * **Behavioral Level**: A practitioner of Jiangnan chivalry. Although his thoughts are rigid, his actions shine with **simple Confucian chivalric spirit**. He gives all he has to help Kuang Chaoren, whom he meets by chance, demonstrating the **human brilliance retained at the practical level** by a person shaped by the system.
+
+* **Tragic Spatial Symbols**
+    * **West Lake in Hangzhou: An Outsider in the World of Desire**. He is completely indifferent to the lake scenery and the colorful crowds, caring only about eating and the Emperor's calligraphy. This marks the **desertification of his sensory world**; his aesthetics and emotions have been completely alienated by the eight-legged essay.
+    * **Mirror Relationship with Kuang Chaoren**: Ma Er is **Kuang Chaoren's spiritual father and frame of reference**. Kuang Chaoren learned composition from him but abandoned his conduct. Ma Er's "immobility" contrasts with the drastic and inevitable nature of Kuang Chaoren's "degeneration".
+""",
+        "search_subheader": "Original Text Keyword Search",
+        "search_label": "Enter Keyword (Traditional Chinese)",
+        "no_results": "No relevant content found.",
+        # Tab 5: Character Route (one entry per route in ROUTES_DATA, same order)
+        "route_subheader": "🚀 Character Trajectories",
+        "route_tooltip": "<b>{name}</b><br/>Active Chapters: {chapters}",
+        "routes": [
+            {"name": "Kuang Chaoren", "chapters": "Ch. 15-20"},
+            {"name": "Ma Chunshang", "chapters": "Ch. 13-15"},
+            {"name": "Niu Buyi", "chapters": "Ch. 10, 20"},
+        ],
+        "route_cards": [
+            ("Kuang Chaoren", "Route: Wenzhou -> Beijing", "A path of degeneration from the periphery to the center."),
+            ("Ma Chunshang", "Route: Jiaxing -> Hangzhou", "Adhering to the Confucian orthodoxy in Jiangnan."),
+            ("Niu Buyi", "Route: Huzhou -> Wuhu", "The desolation of wandering and dying in a foreign land."),
+        ],
+    },
+    "zh": {
+        "page_title": "儒林外史地点分析",
+        "missing_data": "❌ 缺少基础数据文件，请检查 GitHub 仓库中是否上传了 csv 和 txt 文件。",
+        "title": "🗺️ 《儒林外史》第10-20回空间分析",
+        "intro": """
+本应用结合了**GIS空间分析**与**文本细读**，主要探讨士人在名利场（杭州）与权力中心（北京）之间的流动。
+""",
+        # 侧边栏
+        "sidebar_header": "📊 数据控制台",
+        "loaded_locations": "✅ 已加载地点数据: {n} 个",
+        "loaded_chapters": "✅ 已加载情节数据: {n} 章",
+        "no_chapter_info": "⚠️ 未找到章节情节 Excel 文件",
+        "map_preview": "**地图数据预览:**",
+        "tabs": ["📍 空间分布 (Map)", "📈 动态演变 (Trend)", "📖 章节详情 (Details)", "🧐 深度分析 (Insights)",
+                 "🚀 人物轨迹 (Route)"],
+        # Tab 1: 地图与排名
+        "map_subheader": "地点频次地图",
+        "map_tooltip": "<b>{Name}</b><br/>频次: {Frequency}<br/>性质: {Type}",
+        "ranking_subheader": "总频次排名",
+        # Tab 2: 趋势分析
+        "trend_subheader": "地点在各章节的活跃度",
+        "heatmap_labels": {"x": "章节", "y": "城市", "color": "频次"},
+        "city_names": {
+            "Hangzhou": "杭州 (Hangzhou)", "Huzhou": "湖州 (Huzhou)", "Beijing": "北京 (Beijing)",
+            "Nanjing": "南京 (Nanjing)", "Yangzhou": "揚州 (Yangzhou)", "Jinan": "濟南 (Jinan)",
+            "Suzhou": "蘇州 (Suzhou)", "Wenzhou": "溫州 (Wenzhou)", "Shaoxing": "紹興 (Shaoxing)",
+        },
+        # Tab 3: 章节详情
+        "details_header": "📖 章节人物与情节对照",
+        "select_chapter": "请选择要查看的章节:",
+        "key_characters": "### 🎭 关键人物",
+        "key_events": "### ⚡ 关键事件",
+        "summary": "查看本章小结 (Summary)",
+        "no_data": "无数据",
+        "bad_columns": "Excel 文件列名不匹配，请检查是否包含 'CHAPTER', 'CHARACTERS', 'MAIN PLOTS', 'SUMMARY'",
+        "missing_chapter_info": "请确保上传了 '{path}' 文件。",
+        # Tab 4: 深度分析
+        "insight_subheader": "Insights: 空间与道德的流动",
+        "insights": """
+### 1. 文化空间的二元对立：离心化的市民社会与向心化的权力机器
+
+* **作为“离心化市民社会”的杭州**：杭州呈现为一个**去中心、多节点、自组织**的名利生态圈。这里没有绝对的权威，权力分散在马二先生（选文）、景兰江（诗名）、潘三（衙门）、文剑峰（集会）等各色人物手中。它是一个由**商业资本（书坊）、文化声望（雅集）与地下经济（官司）** 共同驱动的复杂网络。其社会结构是**扁平、流动且充满机遇与陷阱**的，文人在这里体验到的是一种**水平方向的、发散式的挣扎与钻营**。
+
+* **作为“向心化权力机器”的北京**：北京则作为一个**垂直的、等级森严的终极权力场**而存在，其影响力虽远程但无处不在。它通过**科举功名、官场人事与缙绅网络**，像黑洞一样汲取着全国的资源与人才，并规定着所有社会价值的最终取向。在北京，一切行为都被简化为**对更高权力阶层的攀附与寄生**。其社会结构是**金字塔式的、封闭的**，文人在这里体验到的是一种**垂直方向的、压抑而又充满诱惑的晋升焦虑**。
+
+### 2. 匡超人的堕落轨迹 (Spatial Narrative of Moral Degeneration)
+
+* **作为“空间穿越者”的匡超人**：他是**一个在帝国核心文化空间中不断迁徙的样本**。其轨迹从乡村（温州）到区域中心（杭州），最终抵达帝国心脏（北京），完整地演示了一个底层文人如何被不同空间的生产逻辑所塑造。他不是一个地方的固定居民，而是**一个敏锐的空间规则学习者与投机者**，在每个空间都迅速掌握其生存法则并为之异化。
+
+* **思想层面：从儒家伦理到彻底的功利主义**。其思想转变轨迹清晰可辨：始于温州时期**发自天性的孝悌观念**；中经杭州时期在潘三教导下形成的 **“有奶便是娘”的市井生存哲学**；最终定型于北京时期**精于计算的极端利己主义**。他的世界观完成了从**价值理性**到**工具理性**的彻底蜕变。
+
+* **悲剧性空间象征**：
+    * **杭州的文瀚楼**：知识生产的异化之地。在此，他夜夜批注科举范文，这本应是“求知”的神圣空间，却与他替人代考、参与作假的舞弊行为并行不悖。**文瀚楼象征了其“知识”与“道德”的彻底分离**。
+    * **北京的婚房**：身份重构与人性终结的仪式场。在北京的婚房里，他通过一场建立在谎言（隐瞒原配）之上的婚礼，完成了社会身份的洗白与跃升。这个本应象征人伦缔结的喜庆空间，却成了**他埋葬最后一丝良知、将自身彻底工具化的祭坛**。
+
+### 3. 马二先生的坚守与悖论 (The Persistence of Ma Chunshang)
+
+* **文化空间的二元对立：体制守护者与江湖落魄人**
+    * **作为“选家”的马二**：他是**科举知识生产的体制性支柱**。在杭州这个世俗文化市场中，他扮演着将官方意识形态（八股文）转化为可流通、可模仿的标准化商品的角色。他的批语表明他是一个**严谨的、去个人化的知识搬运工**。
+    * **作为“游士”的马二**：他自身又是**脱离于权力中心的边缘文人**。这种“在野的体制守护者”身份，构成了他一切喜剧与悲剧的根源。
+
+* **马二先生的人格结构解析**
+    * **思想层面**：被八股彻底规训的“套中人”。他的世界观完全由举业文章构建，甚至认为“举业二字，是从古及今人人必要做的”。这种思想的**高度纯粹与封闭**，使他显得迂腐，却也构成了他抵御世俗诱惑的**道德甲胄**。
+    * **行为层面**：江湖道义的践行者。尽管思想僵化，但他的行动却闪耀着**朴素的儒家侠义精神**。他倾尽所有资助萍水相逢的匡超人，展现了一个被体制塑造的人在**实践层面保留的人性光辉**。
+
+* **悲剧性空间象征**
+    * **杭州西湖：欲望世界的局外人**。他对湖光山色、红男绿女全然无感，只关心吃喝、皇帝御书。这标志着他**感性世界的荒漠化**，他的审美与情感已被八股文彻底异化。
+    * **与匡超人的镜像关系**：马二是**匡超人精神上的父亲与参照系**。匡超人从他这里学会了作文，却抛弃了他的为人。马二的“不动”反衬了匡超人“堕落”的剧烈与必然。
+""",
+        "search_subheader": "原文关键词检索",
+        "search_label": "输入关键词 (繁体)",
+        "no_results": "未找到相关内容。",
+        # Tab 5: 人物轨迹
+        "route_subheader": "🚀 人物行动轨迹",
+        "route_tooltip": "<b>{name}</b><br/>活动章节: {chapters}",
+        "routes": [
+            {"name": "匡超人 (Kuang Chaoren)", "chapters": "第15-20回"},
+            {"name": "马二先生 (Ma Chunshang)", "chapters": "第13-15回"},
+            {"name": "牛布衣 (Niu Buyi)", "chapters": "第10, 20回"},
+        ],
+        "route_cards": [
+            ("匡超人", "路线：温州 -> 北京", "从边缘向中心的堕落之路。"),
+            ("马二先生", "路线：嘉兴 -> 杭州", "坚守江南的儒家正统。"),
+            ("牛布衣", "路线：湖州 -> 芜湖", "漂泊客死他乡的悲凉。"),
+        ],
+    },
+}